@@ -52,7 +52,7 @@ class GraphAlphaProcRunner(UncallableNamespace, IllegalAttrChecker):
         errors = []
 
         exists = self._query_runner.run_query(
-            f"CALL gds.graph.exists('{graph_name}') YIELD exists", custom_error=False
+            "CALL gds.graph.exists($graph_name) YIELD exists", {"graph_name": graph_name}, custom_error=False
         ).squeeze()
 
         # compare against True as (1) unit tests return None here and (2) numpys True does not work with `is True`.
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from ..caller_base import CallerBase
 from .graph_alpha_proc_runner import GraphAlphaProcRunner
 from .graph_beta_proc_runner import GraphBetaProcRunner
@@ -5,7 +7,7 @@ from .graph_proc_runner import GraphProcRunner
 
 
 class GraphEndpoints(CallerBase):
-    @property
+    @cached_property
     def graph(self) -> GraphProcRunner:
         return GraphProcRunner(self._query_runner, f"{self._namespace}.graph", self._server_version)
 
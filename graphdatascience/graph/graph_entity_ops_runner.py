@@ -47,8 +47,9 @@ class GraphEntityOpsBaseRunner(UncallableNamespace, IllegalAttrChecker):
         properties: Strings,
         entities: Strings,
         config: Dict[str, Any],
+        namespace: str,
     ) -> DataFrame:
-        query = f"CALL {self._namespace}($graph_name, $properties, $entities, $config)"
+        query = f"CALL {namespace}($graph_name, $properties, $entities, $config)"
         params = {
             "graph_name": G.name(),
             "properties": properties,
@@ -62,8 +63,8 @@ class GraphEntityOpsBaseRunner(UncallableNamespace, IllegalAttrChecker):
 class GraphElementPropertyRunner(GraphEntityOpsBaseRunner):
     @compatible_with("stream", min_inclusive=ServerVersion(2, 2, 0))
     def stream(self, G: Graph, node_properties: str, node_labels: Strings = ["*"], **config: Any) -> DataFrame:
-        self._namespace += ".stream"
-        return self._handle_properties(G, node_properties, node_labels, config)
+        namespace = self._namespace + ".stream"
+        return self._handle_properties(G, node_properties, node_labels, config, namespace)
 
 
 class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
@@ -78,9 +79,9 @@ class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
         db_node_properties: List[str] = [],
         **config: Any,
     ) -> DataFrame:
-        self._namespace += ".stream"
+        namespace = self._namespace + ".stream"
 
-        result = self._handle_properties(G, node_properties, node_labels, config)
+        result = self._handle_properties(G, node_properties, node_labels, config, namespace)
 
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
@@ -126,14 +127,14 @@ class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
 
     @compatible_with("write", min_inclusive=ServerVersion(2, 2, 0))
     def write(self, G: Graph, node_properties: List[str], node_labels: Strings = ["*"], **config: Any) -> "Series[Any]":
-        self._namespace += ".write"
-        return self._handle_properties(G, node_properties, node_labels, config).squeeze()  # type: ignore
+        namespace = self._namespace + ".write"
+        return self._handle_properties(G, node_properties, node_labels, config, namespace).squeeze()  # type: ignore
 
     @compatible_with("drop", min_inclusive=ServerVersion(2, 2, 0))
     @graph_type_check
     def drop(self, G: Graph, node_properties: List[str], **config: Any) -> "Series[Any]":
-        self._namespace += ".drop"
-        query = f"CALL {self._namespace}($graph_name, $properties, $config)"
+        namespace = self._namespace + ".drop"
+        query = f"CALL {namespace}($graph_name, $properties, $config)"
         params = {
             "graph_name": G.name(),
             "properties": node_properties,
@@ -153,9 +154,9 @@ class GraphRelationshipPropertiesRunner(GraphEntityOpsBaseRunner):
         separate_property_columns: bool = False,
         **config: Any,
     ) -> DataFrame:
-        self._namespace += ".stream"
+        namespace = self._namespace + ".stream"
 
-        result = self._handle_properties(G, relationship_properties, relationship_types, config)
+        result = self._handle_properties(G, relationship_properties, relationship_types, config, namespace)
 
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
@@ -183,9 +184,9 @@ class GraphRelationshipPropertiesRunner(GraphEntityOpsBaseRunner):
         relationship_properties: List[str],
         **config: Any,
     ) -> "Series[Any]":
-        self._namespace += ".write"
+        namespace = self._namespace + ".write"
 
-        query = f"CALL {self._namespace}($graph_name, $relationship_type, $relationship_properties, $config)"
+        query = f"CALL {namespace}($graph_name, $relationship_type, $relationship_properties, $config)"
         params = {
             "graph_name": G.name(),
             "relationship_type": relationship_type,
@@ -200,8 +201,8 @@ class GraphRelationshipRunner(GraphEntityOpsBaseRunner):
     @compatible_with("write", min_inclusive=ServerVersion(2, 2, 0))
     @graph_type_check
     def write(self, G: Graph, relationship_type: str, relationship_property: str = "", **config: Any) -> "Series[Any]":
-        self._namespace += ".write"
-        query = f"CALL {self._namespace}($graph_name, $relationship_type, $relationship_property, $config)"
+        namespace = self._namespace + ".write"
+        query = f"CALL {namespace}($graph_name, $relationship_type, $relationship_property, $config)"
         params = {
             "graph_name": G.name(),
             "relationship_type": relationship_type,
@@ -245,8 +246,8 @@ class GraphRelationshipsRunner(GraphEntityOpsBaseRunner):
         G: Graph,
         relationship_type: str,
     ) -> "Series[Any]":
-        self._namespace += ".drop"
-        query = f"CALL {self._namespace}($graph_name, $relationship_type)"
+        namespace = self._namespace + ".drop"
+        query = f"CALL {namespace}($graph_name, $relationship_type)"
         params = {
             "graph_name": G.name(),
             "relationship_type": relationship_type,
@@ -257,8 +258,8 @@ class GraphRelationshipsRunner(GraphEntityOpsBaseRunner):
     @compatible_with("stream", min_inclusive=ServerVersion(2, 5, 0))
     @graph_type_check
     def stream(self, G: Graph, relationship_types: List[str] = ["*"], **config: Any) -> TopologyDataFrame:
-        self._namespace += ".stream"
-        query = f"CALL {self._namespace}($graph_name, $relationship_types, $config)"
+        namespace = self._namespace + ".stream"
+        query = f"CALL {namespace}($graph_name, $relationship_types, $config)"
 
         params = {"graph_name": G.name(), "relationship_types": relationship_types, "config": config}
 
@@ -267,16 +268,16 @@ class GraphRelationshipsRunner(GraphEntityOpsBaseRunner):
     @property
     @compatible_with("toUndirected", min_inclusive=ServerVersion(2, 5, 0))
     def toUndirected(self) -> ToUndirectedRunner:
-        self._namespace += ".toUndirected"
-        return ToUndirectedRunner(self._query_runner, self._namespace, self._server_version)
+        namespace = self._namespace + ".toUndirected"
+        return ToUndirectedRunner(self._query_runner, namespace, self._server_version)
 
 
 class GraphRelationshipsBetaRunner(GraphEntityOpsBaseRunner):
     @compatible_with("stream", min_inclusive=ServerVersion(2, 2, 0))
     @graph_type_check
     def stream(self, G: Graph, relationship_types: List[str] = ["*"], **config: Any) -> TopologyDataFrame:
-        self._namespace += ".stream"
-        query = f"CALL {self._namespace}($graph_name, $relationship_types, $config)"
+        namespace = self._namespace + ".stream"
+        query = f"CALL {namespace}($graph_name, $relationship_types, $config)"
 
         params = {"graph_name": G.name(), "relationship_types": relationship_types, "config": config}
 
@@ -285,8 +286,8 @@ class GraphRelationshipsBetaRunner(GraphEntityOpsBaseRunner):
     @property
     @compatible_with("toUndirected", min_inclusive=ServerVersion(2, 3, 0))
     def toUndirected(self) -> ToUndirectedRunner:
-        self._namespace += ".toUndirected"
-        return ToUndirectedRunner(self._query_runner, self._namespace, self._server_version)
+        namespace = self._namespace + ".toUndirected"
+        return ToUndirectedRunner(self._query_runner, namespace, self._server_version)
 
 
 class GraphPropertyRunner(UncallableNamespace, IllegalAttrChecker):
@@ -298,8 +299,8 @@ class GraphPropertyRunner(UncallableNamespace, IllegalAttrChecker):
         graph_property: str,
         **config: Any,
     ) -> DataFrame:
-        self._namespace += ".stream"
-        query = f"CALL {self._namespace}($graph_name, $graph_property, $config)"
+        namespace = self._namespace + ".stream"
+        query = f"CALL {namespace}($graph_name, $graph_property, $config)"
         params = {"graph_name": G.name(), "graph_property": graph_property, "config": config}
 
         return self._query_runner.run_query(query, params)
@@ -312,8 +313,8 @@ class GraphPropertyRunner(UncallableNamespace, IllegalAttrChecker):
         graph_property: str,
         **config: Any,
     ) -> "Series[Any]":
-        self._namespace += ".drop"
-        query = f"CALL {self._namespace}($graph_name, $graph_property, $config)"
+        namespace = self._namespace + ".drop"
+        query = f"CALL {namespace}($graph_name, $graph_property, $config)"
         params = {"graph_name": G.name(), "graph_property": graph_property, "config": config}
 
         return self._query_runner.run_query(query, params)  # type: ignore
@@ -323,8 +324,8 @@ class GraphLabelRunner(GraphEntityOpsBaseRunner):
     @compatible_with("write", min_inclusive=ServerVersion(2, 3, 0))
     @graph_type_check
     def write(self, G: Graph, node_label: str, **config: Any) -> "Series[Any]":
-        self._namespace += ".write"
-        query = f"CALL {self._namespace}($graph_name, $node_label, $config)"
+        namespace = self._namespace + ".write"
+        query = f"CALL {namespace}($graph_name, $node_label, $config)"
         params = {
             "graph_name": G.name(),
             "node_label": node_label,
@@ -336,8 +337,8 @@ class GraphLabelRunner(GraphEntityOpsBaseRunner):
     @compatible_with("mutate", min_inclusive=ServerVersion(2, 3, 0))
     @graph_type_check
     def mutate(self, G: Graph, node_label: str, **config: Any) -> "Series[Any]":
-        self._namespace += ".mutate"
-        query = f"CALL {self._namespace}($graph_name, $node_label, $config)"
+        namespace = self._namespace + ".mutate"
+        query = f"CALL {namespace}($graph_name, $node_label, $config)"
         params = {
             "graph_name": G.name(),
             "node_label": node_label,
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Dict
 
 from pandas import Series
@@ -11,28 +12,24 @@ from .graph_type_check import graph_type_check
 class GraphExportCsvRunner(IllegalAttrChecker):
     # TODO: Add an integration test for this call.
     def __call__(self, G: Graph, **config: Any) -> "Series[Any]":
-        return self._export_call(G, config)
+        return self._export_call(G, config, self._namespace)
 
     @graph_type_check
-    def _export_call(self, G: Graph, config: Dict[str, Any]) -> "Series[Any]":
-        query = f"CALL {self._namespace}($graph_name, $config)"
+    def _export_call(self, G: Graph, config: Dict[str, Any], namespace: str) -> "Series[Any]":
+        query = f"CALL {namespace}($graph_name, $config)"
         params = {"graph_name": G.name(), "config": config}
 
         return self._query_runner.run_query(query, params).squeeze()  # type: ignore
 
     @graph_type_check
     def estimate(self, G: Graph, **config: Any) -> "Series[Any]":
-        self._namespace += ".estimate"
-
-        return self._export_call(G, config)
+        return self._export_call(G, config, self._namespace + ".estimate")
 
 
 class GraphExportCsvEndpoints(UncallableNamespace, IllegalAttrChecker):
-    @property
+    @cached_property
     def csv(self) -> GraphExportCsvRunner:
-        self._namespace += ".csv"
-
-        return GraphExportCsvRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphExportCsvRunner(self._query_runner, f"{self._namespace}.csv", self._server_version)
 
 
 class GraphExportRunner(IllegalAttrChecker):
@@ -46,8 +43,6 @@ class GraphExportRunner(IllegalAttrChecker):
 
         return self._query_runner.run_query(query, params).squeeze()  # type: ignore
 
-    @property
+    @cached_property
     def csv(self) -> GraphExportCsvRunner:
-        self._namespace += ".csv"
-
-        return GraphExportCsvRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphExportCsvRunner(self._query_runner, f"{self._namespace}.csv", self._server_version)
@@ -1,16 +1,24 @@
+import atexit
 import os
 import pathlib
 import sys
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Optional, Union
 
-import pandas as pd
+import pyarrow
 from multimethod import multimethod
-from neo4j import __version__ as neo4j_driver_version
-from pandas import DataFrame, Series, read_parquet
+from pandas import DataFrame, Series
+from pyarrow import Table
 
 from ..error.client_only_endpoint import client_only_endpoint
 from ..error.illegal_attr_checker import IllegalAttrChecker
 from ..error.uncallable_namespace import UncallableNamespace
+from ..query_runner.graph_constructor import GraphData
+from ..query_runner.query_runner import QueryRunner
 from ..server_version.compatible_with import compatible_with
 from ..server_version.server_version import ServerVersion
 from .graph_entity_ops_runner import (
@@ -37,49 +45,154 @@ from graphdatascience.graph.graph_cypher_runner import GraphCypherRunner
 
 Strings = Union[str, List[str]]
 
-is_neo4j_4_driver = ServerVersion.from_string(neo4j_driver_version) < ServerVersion(5, 0, 0)
+_REQUIRED_NODE_COLUMNS = frozenset(("nodeId",))
+_REQUIRED_REL_COLUMNS = frozenset(("sourceNodeId", "targetNodeId"))
+
+_DATASET_PACKAGES = (
+    "graphdatascience.resources.cora",
+    "graphdatascience.resources.imdb",
+    "graphdatascience.resources.karate",
+    "graphdatascience.resources.lastfm",
+)
+
+# Tables are immutable, so the same one can be handed out on every load
+_KARATE_NODES = pyarrow.table({"nodeId": range(1, 35), "labels": ["Person"] * 34})
+
+
+def _io_thread_count(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+
+    if count < 1:
+        warnings.warn(
+            f"Ignoring GDS_IO_THREADS={value!r}, it must be a positive integer. Using pyarrow's default instead.",
+            RuntimeWarning,
+        )
+        return None
+
+    return count
+
+
+# Size of pyarrow's IO thread pool used for reading the datasets, pyarrow's own default is kept if unset or invalid
+_GDS_IO_THREADS = _io_thread_count(os.environ.get("GDS_IO_THREADS"))
+if _GDS_IO_THREADS is not None:
+    pyarrow.set_io_thread_count(_GDS_IO_THREADS)
+
+
+@lru_cache(maxsize=None)
+def _pkg_files(package: str) -> Any:
+    from importlib.resources import files
+
+    return files(package)
+
+
+# Only used for the bundled dataset files, so the cache stays small
+@lru_cache(maxsize=None)
+def _parquet_metadata(path: str, mtime: float) -> Any:
+    import pyarrow.parquet as pq
+
+    return pq.read_metadata(path)
+
+
+def _read_parquet(path: pathlib.Path) -> Table:
+    # pyarrow.parquet is only needed for the bundled datasets, so defer its import until one is loaded
+    import pyarrow.parquet as pq
+
+    metadata = _parquet_metadata(str(path), path.stat().st_mtime)
+
+    # pre-buffering coalesces the reads of all column chunks into few larger background reads
+    return pq.ParquetFile(path, metadata=metadata, pre_buffer=True).read(use_threads=True)
+
+
+def _read_parquets(paths: List[pathlib.Path]) -> List[Table]:
+    # pyarrow releases the GIL while reading and decompressing, so the files can be read concurrently
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return list(executor.map(_read_parquet, paths))
+
+
+def _prewarm_dataset_files() -> None:
+    for package in _DATASET_PACKAGES:
+        package_dir = GraphProcRunner._path(package, "__init__.py").parent
+        for file in package_dir.glob("*.parquet.gzip"):
+            with open(file, "rb") as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    while f.read(1 << 20):
+                        pass
+
+
+@lru_cache(maxsize=None)
+def _start_dataset_prewarm() -> None:
+    # Pulls the bundled datasets into the page cache so that a following `load_*` call does not wait on the disk
+    threading.Thread(target=_prewarm_dataset_files, name="gds-dataset-prewarm", daemon=True).start()
+
+
+def _column_names(df: GraphData) -> Any:
+    return df.column_names if isinstance(df, Table) else df.columns
+
+
+def _nonempty(dfs: List[GraphData]) -> List[GraphData]:
+    # avoid rebuilding the list in the common case of no empty dataframes
+    if all(df.shape[0] for df in dfs):
+        return dfs
+
+    return [df for df in dfs if df.shape[0]]
 
 
 class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
+    # Keeps resource paths resolved on python 3.8 valid until interpreter shutdown
+    _resource_stack = ExitStack()
+    atexit.register(_resource_stack.close)
+
+    def __init__(self, query_runner: QueryRunner, namespace: str, server_version: ServerVersion):
+        super().__init__(query_runner, namespace, server_version)
+
+        if os.environ.get("GDS_PREWARM") == "1":
+            _start_dataset_prewarm()
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def _path(package: str, resource: str) -> pathlib.Path:
         if sys.version_info >= (3, 9):
-            from importlib.resources import files
-
             # files() returns a Traversable, but usages require a Path object
-            return pathlib.Path(str(files(package) / resource))
+            return pathlib.Path(str(_pkg_files(package).joinpath(resource)))
         else:
             from importlib.resources import path
 
-            # we dont want to use a context manager here, so we need to call __enter__ manually
-            return path(package, resource).__enter__()
+            return GraphProcRunner._resource_stack.enter_context(path(package, resource))
 
     @client_only_endpoint("gds.graph")
     @compatible_with("construct", min_inclusive=ServerVersion(2, 1, 0))
     def construct(
         self,
         graph_name: str,
-        nodes: Union[DataFrame, List[DataFrame]],
-        relationships: Optional[Union[DataFrame, List[DataFrame]]] = None,
+        nodes: Union[GraphData, List[GraphData]],
+        relationships: Optional[Union[GraphData, List[GraphData]]] = None,
         concurrency: int = 4,
         undirected_relationship_types: Optional[List[str]] = None,
     ) -> Graph:
         nodes = nodes if isinstance(nodes, List) else [nodes]
 
-        if isinstance(relationships, DataFrame):
+        if isinstance(relationships, (DataFrame, Table)):
             relationships = [relationships]
         elif relationships is None:
             relationships = []
 
         # Filter empty dataframes
-        nodes = [df for df in nodes if not df.empty]
-        relationships = [df for df in relationships if not df.empty]
+        nodes = _nonempty(nodes)
+        relationships = _nonempty(relationships)
 
-        errors = []
+        errors: List[str] = []
 
         exists = self._query_runner.run_query(
-            f"CALL gds.graph.exists('{graph_name}') YIELD exists", custom_error=False
-        ).squeeze()
+            "CALL gds.graph.exists($graph_name) YIELD exists", {"graph_name": graph_name}, custom_error=False
+        ).iat[0, 0]
 
         # compare against True as (1) unit tests return None here and (2) numpys True does not work with `is True`.
         if exists == True:  # noqa: E712
@@ -87,17 +200,18 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
                 f"Graph '{graph_name}' already exists. Please drop the existing graph or use a different name."
             )
 
+        errors_append = errors.append
+
         for idx, node_df in enumerate(nodes):
-            if "nodeId" not in node_df.columns.values:
-                errors.append(f"Node dataframe at index {idx} needs to contain a 'nodeId' column.")
+            for missing_col in sorted(_REQUIRED_NODE_COLUMNS.difference(_column_names(node_df))):
+                errors_append(f"Node dataframe at index {idx} needs to contain a '{missing_col}' column.")
 
         for idx, rel_df in enumerate(relationships):
-            for expected_col in ["sourceNodeId", "targetNodeId"]:
-                if expected_col not in rel_df.columns.values:
-                    errors.append(f"Relationship dataframe at index {idx} needs to contain a '{expected_col}' column.")
+            for missing_col in sorted(_REQUIRED_REL_COLUMNS.difference(_column_names(rel_df))):
+                errors_append(f"Relationship dataframe at index {idx} needs to contain a '{missing_col}' column.")
 
         if self._server_version < ServerVersion(2, 3, 0) and undirected_relationship_types:
-            errors.append("The parameter 'undirected_relationship_types' is only supported since GDS 2.3.0.")
+            errors_append("The parameter 'undirected_relationship_types' is only supported since GDS 2.3.0.")
 
         if len(errors) > 0:
             raise ValueError(os.linesep.join(errors))
@@ -112,13 +226,8 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
     @client_only_endpoint("gds.graph")
     def load_cora(self, graph_name: str = "cora", undirected: bool = False) -> Graph:
         file = self._path("graphdatascience.resources.cora", "cora_nodes.parquet.gzip")
-        nodes = read_parquet(file)
-
-        if is_neo4j_4_driver:
-            # features is read as an ndarray which was not supported in neo4j 4
-            nodes["features"] = nodes["features"].apply(lambda x: x.tolist())
-
-        rels = read_parquet(self._path("graphdatascience.resources.cora", "cora_rels.parquet.gzip"))
+        nodes = _read_parquet(file)
+        rels = _read_parquet(self._path("graphdatascience.resources.cora", "cora_rels.parquet.gzip"))
 
         undirected_relationship_types = ["*"] if undirected else []
 
@@ -126,14 +235,13 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
 
     @client_only_endpoint("gds.graph")
     def load_karate_club(self, graph_name: str = "karate_club", undirected: bool = False) -> Graph:
-        nodes = pd.DataFrame({"nodeId": range(1, 35)})
-        nodes["labels"] = "Person"
-
-        rels = read_parquet(self._path("graphdatascience.resources.karate", "karate_club.parquet.gzip"))
+        rels = _read_parquet(self._path("graphdatascience.resources.karate", "karate_club.parquet.gzip"))
 
         undirected_relationship_types = ["*"] if undirected else []
 
-        return self.construct(graph_name, nodes, rels, undirected_relationship_types=undirected_relationship_types)
+        return self.construct(
+            graph_name, _KARATE_NODES, rels, undirected_relationship_types=undirected_relationship_types
+        )
 
     @client_only_endpoint("gds.graph")
     def load_imdb(self, graph_name: str = "imdb", undirected: bool = True) -> Graph:
@@ -144,19 +252,9 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         nodes = ["movies_with_genre", "movies_without_genre", "actors", "directors"]
         rels = ["acted_in", "directed_in"]
 
-        node_dfs = []
-        for n in nodes:
-            resource = self._path(package, f"imdb_{n}.parquet.gzip")
-            df = read_parquet(resource)
-            if is_neo4j_4_driver:
-                # features is read as an ndarray which was not supported in neo4j 4
-                df["plot_keywords"] = df["plot_keywords"].apply(lambda x: x.tolist())
-            node_dfs.append(df)
-
-        rel_dfs = []
-        for r in rels:
-            resource = self._path(package, f"imdb_{r}.parquet.gzip")
-            rel_dfs.append(read_parquet(resource))
+        dfs = _read_parquets([self._path(package, f"imdb_{f}.parquet.gzip") for f in nodes + rels])
+        split = len(nodes)
+        node_dfs, rel_dfs = dfs[:split], dfs[split:]
 
         # Default undirected which matches raw data
         undirected_relationship_types = ["*"] if undirected else []
@@ -175,15 +273,9 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
 
         package = "graphdatascience.resources.lastfm"
 
-        node_dfs = []
-        for n in nodes:
-            resource = self._path(package, f"{n}.parquet.gzip")
-            node_dfs.append(read_parquet(resource))
-
-        rel_dfs = []
-        for r in rels:
-            resource = self._path(package, f"{r}.parquet.gzip")
-            rel_dfs.append(read_parquet(resource))
+        dfs = _read_parquets([self._path(package, f"{f}.parquet.gzip") for f in nodes + rels])
+        split = len(nodes)
+        node_dfs, rel_dfs = dfs[:split], dfs[split:]
 
         # Default undirected for usage in GDS ML pipelines
         if undirected:
@@ -195,12 +287,11 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
             graph_name, node_dfs, rel_dfs, undirected_relationship_types=undirected_relationship_types
         )
 
-    @property
+    @cached_property
     def sample(self) -> GraphSampleRunner:
-        self._namespace += ".sample"
-        return GraphSampleRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphSampleRunner(self._query_runner, f"{self._namespace}.sample", self._server_version)
 
-    @property
+    @cached_property
     def networkx(self):  # type: ignore
         try:
             from .nx_loader import NXLoader
@@ -210,36 +301,31 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
                 "You can add NetworkX support by running `pip install graphdatascience[networkx]`"
             )
 
-        self._namespace += ".networkx"
-        return NXLoader(self._query_runner, self._namespace, self._server_version)
+        return NXLoader(self._query_runner, f"{self._namespace}.networkx", self._server_version)
 
-    @property
+    @cached_property
     def project(self) -> GraphProjectRunner:
-        self._namespace += ".project"
-        return GraphProjectRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphProjectRunner(self._query_runner, f"{self._namespace}.project", self._server_version)
 
-    @property
+    @cached_property
     @compatible_with("graphProperty", min_inclusive=ServerVersion(2, 5, 0))
     def graphProperty(self) -> GraphPropertyRunner:
-        self._namespace += ".graphProperty"
-        return GraphPropertyRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphPropertyRunner(self._query_runner, f"{self._namespace}.graphProperty", self._server_version)
 
-    @property
+    @cached_property
     @compatible_with("nodeLabel", min_inclusive=ServerVersion(2, 5, 0))
     def nodeLabel(self) -> GraphLabelRunner:
-        self._namespace += ".nodeLabel"
-        return GraphLabelRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphLabelRunner(self._query_runner, f"{self._namespace}.nodeLabel", self._server_version)
 
-    @property
+    @cached_property
     def cypher(self) -> GraphCypherRunner:
-        self._namespace += ".project"
-        return GraphCypherRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphCypherRunner(self._query_runner, f"{self._namespace}.project", self._server_version)
 
     @compatible_with("generate", min_inclusive=ServerVersion(2, 5, 0))
     def generate(self, graph_name: str, node_count: int, average_degree: int, **config: Any) -> GraphCreateResult:
-        self._namespace += ".generate"
+        namespace = self._namespace + ".generate"
 
-        query = f"CALL {self._namespace}($graph_name, $node_count, $average_degree, $config)"
+        query = f"CALL {namespace}($graph_name, $node_count, $average_degree, $config)"
         params = {
             "graph_name": graph_name,
             "node_count": node_count,
@@ -261,9 +347,9 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         relationship_filter: str,
         **config: Any,
     ) -> GraphCreateResult:
-        self._namespace += ".filter"
+        namespace = self._namespace + ".filter"
         result = self._query_runner.run_query_with_logging(
-            f"CALL {self._namespace}($graph_name, $from_graph_name, $node_filter, $relationship_filter, $config)",
+            f"CALL {namespace}($graph_name, $from_graph_name, $node_filter, $relationship_filter, $config)",
             {
                 "graph_name": graph_name,
                 "from_graph_name": from_G.name(),
@@ -275,20 +361,17 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
 
         return GraphCreateResult(Graph(graph_name, self._query_runner, self._server_version), result)
 
-    @property
+    @cached_property
     def export(self) -> GraphExportRunner:
-        self._namespace += ".export"
-        return GraphExportRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphExportRunner(self._query_runner, f"{self._namespace}.export", self._server_version)
 
-    @property
+    @cached_property
     def ogbn(self) -> OGBNLoader:
-        self._namespace += ".ogbn"
-        return OGBNLoader(self._query_runner, self._namespace, self._server_version)
+        return OGBNLoader(self._query_runner, f"{self._namespace}.ogbn", self._server_version)
 
-    @property
+    @cached_property
     def ogbl(self) -> OGBLLoader:
-        self._namespace += ".ogbl"
-        return OGBLLoader(self._query_runner, self._namespace, self._server_version)
+        return OGBLLoader(self._query_runner, f"{self._namespace}.ogbl", self._server_version)
 
     @graph_type_check
     def drop(
@@ -298,7 +381,7 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         dbName: str = "",
         username: Optional[str] = None,
     ) -> Optional["Series[Any]"]:
-        self._namespace += ".drop"
+        namespace = self._namespace + ".drop"
 
         params = {
             "graph_name": G.name(),
@@ -306,10 +389,10 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
             "db_name": dbName,
         }
         if username:
-            query = f"CALL {self._namespace}($graph_name, $fail_if_missing, $db_name, $username)"
+            query = f"CALL {namespace}($graph_name, $fail_if_missing, $db_name, $username)"
             params["username"] = username
         else:
-            query = f"CALL {self._namespace}($graph_name, $fail_if_missing, $db_name)"
+            query = f"CALL {namespace}($graph_name, $fail_if_missing, $db_name)"
 
         result = self._query_runner.run_query(query, params)
         if not result.empty:
@@ -318,17 +401,17 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         return None
 
     def exists(self, graph_name: str) -> "Series[Any]":
-        self._namespace += ".exists"
-        result = self._query_runner.run_query(f"CALL {self._namespace}($graph_name)", {"graph_name": graph_name})
+        namespace = self._namespace + ".exists"
+        result = self._query_runner.run_query(f"CALL {namespace}($graph_name)", {"graph_name": graph_name})
 
         return result.squeeze()  # type: ignore
 
     @graph_type_check_optional
     def list(self, G: Optional[Graph] = None) -> DataFrame:
-        self._namespace += ".list"
+        namespace = self._namespace + ".list"
 
         if G:
-            query = f"CALL {self._namespace}($graph_name)"
+            query = f"CALL {namespace}($graph_name)"
             params = {"graph_name": G.name()}
         else:
             query = "CALL gds.graph.list()"
@@ -339,7 +422,7 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
     @client_only_endpoint("gds.graph")
     def get(self, graph_name: str) -> Graph:
         result = self._query_runner.run_query(
-            f"CALL gds.graph.list('{graph_name}') YIELD graphName", custom_error=False
+            "CALL gds.graph.list($graph_name) YIELD graphName", {"graph_name": graph_name}, custom_error=False
         )
         if len(result["graphName"]) == 0:
             raise ValueError(
@@ -355,8 +438,9 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         properties: Strings,
         entities: Strings,
         config: Dict[str, Any],
+        namespace: str,
     ) -> DataFrame:
-        query = f"CALL {self._namespace}($graph_name, $properties, $entities, $config)"
+        query = f"CALL {namespace}($graph_name, $properties, $entities, $config)"
         params = {
             "graph_name": G.name(),
             "properties": properties,
@@ -366,35 +450,33 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
 
         return self._query_runner.run_query(query, params)
 
-    @property
+    @cached_property
     def nodeProperty(self) -> GraphElementPropertyRunner:
-        self._namespace += ".nodeProperty"
-        return GraphElementPropertyRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphElementPropertyRunner(self._query_runner, f"{self._namespace}.nodeProperty", self._server_version)
 
-    @property
+    @cached_property
     def nodeProperties(self) -> GraphNodePropertiesRunner:
-        self._namespace += ".nodeProperties"
-        return GraphNodePropertiesRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphNodePropertiesRunner(self._query_runner, f"{self._namespace}.nodeProperties", self._server_version)
 
-    @property
+    @cached_property
     def relationshipProperty(self) -> GraphElementPropertyRunner:
-        self._namespace += ".relationshipProperty"
-        return GraphElementPropertyRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphElementPropertyRunner(
+            self._query_runner, f"{self._namespace}.relationshipProperty", self._server_version
+        )
 
-    @property
+    @cached_property
     def relationshipProperties(self) -> GraphRelationshipPropertiesRunner:
-        self._namespace += ".relationshipProperties"
-        return GraphRelationshipPropertiesRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphRelationshipPropertiesRunner(
+            self._query_runner, f"{self._namespace}.relationshipProperties", self._server_version
+        )
 
-    @property
+    @cached_property
     def relationship(self) -> GraphRelationshipRunner:
-        self._namespace += ".relationship"
-        return GraphRelationshipRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphRelationshipRunner(self._query_runner, f"{self._namespace}.relationship", self._server_version)
 
-    @property
+    @cached_property
     def relationships(self) -> GraphRelationshipsRunner:
-        self._namespace += ".relationships"
-        return GraphRelationshipsRunner(self._query_runner, self._namespace, self._server_version)
+        return GraphRelationshipsRunner(self._query_runner, f"{self._namespace}.relationships", self._server_version)
 
     def streamNodeProperties(
         self,
@@ -404,15 +486,18 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         separate_property_columns: bool = False,
         **config: Any,
     ) -> DataFrame:
-        self._namespace += ".streamNodeProperties"
+        namespace = self._namespace + ".streamNodeProperties"
 
-        result = self._handle_properties(G, node_properties, node_labels, config)
+        result = self._handle_properties(G, node_properties, node_labels, config, namespace)
 
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
-            result = result.pivot(index="nodeId", columns="nodeProperty", values="propertyValue")
-            result = result.reset_index()
-            result.columns.name = None
+            result = (
+                result.set_index(["nodeId", "nodeProperty"])["propertyValue"]
+                .unstack("nodeProperty")
+                .rename_axis(None, axis=1)
+                .reset_index()
+            )
         # old format was requested but the query was run via Arrow
         elif not separate_property_columns and "propertyValue" not in result.keys():
             result = result.melt(id_vars=["nodeId"]).rename(
@@ -428,9 +513,9 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         node_labels: Strings = ["*"],
         **config: Any,
     ) -> DataFrame:
-        self._namespace += ".streamNodeProperty"
+        namespace = self._namespace + ".streamNodeProperty"
 
-        return self._handle_properties(G, node_properties, node_labels, config)
+        return self._handle_properties(G, node_properties, node_labels, config, namespace)
 
     def streamRelationshipProperties(
         self,
@@ -440,19 +525,20 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         separate_property_columns: bool = False,
         **config: Any,
     ) -> DataFrame:
-        self._namespace += ".streamRelationshipProperties"
+        namespace = self._namespace + ".streamRelationshipProperties"
 
-        result = self._handle_properties(G, relationship_properties, relationship_types, config)
+        result = self._handle_properties(G, relationship_properties, relationship_types, config, namespace)
 
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
-            result = result.pivot(
-                index=["sourceNodeId", "targetNodeId", "relationshipType"],
-                columns="relationshipProperty",
-                values="propertyValue",
+            result = (
+                result.set_index(["sourceNodeId", "targetNodeId", "relationshipType", "relationshipProperty"])[
+                    "propertyValue"
+                ]
+                .unstack("relationshipProperty")
+                .rename_axis(None, axis=1)
+                .reset_index()
             )
-            result = result.reset_index()
-            result.columns.name = None
         # old format was requested but the query was run via Arrow
         elif not separate_property_columns and "propertyValue" not in result.keys():
             result = result.melt(id_vars=["sourceNodeId", "targetNodeId", "relationshipType"]).rename(
@@ -468,9 +554,9 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         relationship_types: Strings = ["*"],
         **config: Any,
     ) -> DataFrame:
-        self._namespace += ".streamRelationshipProperty"
+        namespace = self._namespace + ".streamRelationshipProperty"
 
-        return self._handle_properties(G, relationship_properties, relationship_types, config)
+        return self._handle_properties(G, relationship_properties, relationship_types, config, namespace)
 
     def writeNodeProperties(
         self,
@@ -479,9 +565,9 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         node_labels: Strings = ["*"],
         **config: Any,
     ) -> "Series[Any]":
-        self._namespace += ".writeNodeProperties"
+        namespace = self._namespace + ".writeNodeProperties"
 
-        return self._handle_properties(G, node_properties, node_labels, config).squeeze()  # type: ignore
+        return self._handle_properties(G, node_properties, node_labels, config, namespace).squeeze()  # type: ignore
 
     def writeRelationship(
         self,
@@ -490,9 +576,9 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         relationship_property: str = "",
         **config: Any,
     ) -> "Series[Any]":
-        self._namespace += ".writeRelationship"
+        namespace = self._namespace + ".writeRelationship"
 
-        query = f"CALL {self._namespace}($graph_name, $relationship_type, $relationship_property, $config)"
+        query = f"CALL {namespace}($graph_name, $relationship_type, $relationship_property, $config)"
         params = {
             "graph_name": G.name(),
             "relationship_type": relationship_type,
@@ -514,9 +600,9 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         node_properties: List[str],
         **config: Any,
     ) -> Series:  # type: ignore
-        self._namespace += ".removeNodeProperties"
+        namespace = self._namespace + ".removeNodeProperties"
 
-        query = f"CALL {self._namespace}($graph_name, $properties, $config)"
+        query = f"CALL {namespace}($graph_name, $properties, $config)"
         params = {
             "graph_name": G.name(),
             "properties": node_properties,
@@ -535,15 +621,15 @@ class GraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         node_labels: Strings,
         **config: Any,
     ) -> Series:  # type: ignore
-        self._namespace += ".removeNodeProperties"
+        namespace = self._namespace + ".removeNodeProperties"
 
-        return self._handle_properties(G, node_properties, node_labels, config).squeeze()  # type: ignore
+        return self._handle_properties(G, node_properties, node_labels, config, namespace).squeeze()  # type: ignore
 
     @graph_type_check
     def deleteRelationships(self, G: Graph, relationship_type: str) -> "Series[Any]":
-        self._namespace += ".deleteRelationships"
+        namespace = self._namespace + ".deleteRelationships"
 
-        query = f"CALL {self._namespace}($graph_name, $relationship_type)"
+        query = f"CALL {namespace}($graph_name, $relationship_type)"
         params = {
             "graph_name": G.name(),
             "relationship_type": relationship_type,
@@ -23,9 +23,9 @@ class GraphProjectRunner(IllegalAttrChecker):
         return GraphCreateResult(Graph(graph_name, self._query_runner, self._server_version), result)
 
     def estimate(self, node_projection: Any, relationship_projection: Any, **config: Any) -> "Series[Any]":
-        self._namespace += ".estimate"
+        namespace = self._namespace + ".estimate"
         result = self._query_runner.run_query(
-            f"CALL {self._namespace}($node_spec, $relationship_spec, $config)",
+            f"CALL {namespace}($node_spec, $relationship_spec, $config)",
             {
                 "node_spec": node_projection,
                 "relationship_spec": relationship_projection,
@@ -50,9 +50,9 @@ class GraphProjectBetaRunner(IllegalAttrChecker):
         relationship_filter: str,
         **config: Any,
     ) -> GraphCreateResult:
-        self._namespace += ".subgraph"
+        namespace = self._namespace + ".subgraph"
         result = self._query_runner.run_query_with_logging(
-            f"CALL {self._namespace}($graph_name, $from_graph_name, $node_filter, $relationship_filter, $config)",
+            f"CALL {namespace}($graph_name, $from_graph_name, $node_filter, $relationship_filter, $config)",
             {
                 "graph_name": graph_name,
                 "from_graph_name": from_G.name(),
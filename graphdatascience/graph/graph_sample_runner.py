@@ -1,8 +1,10 @@
+from functools import cached_property
 from typing import Any
 
 from pandas import Series
 
 from ..error.illegal_attr_checker import IllegalAttrChecker
+from ..query_runner.query_runner import QueryRunner
 from ..server_version.compatible_with import compatible_with
 from ..server_version.server_version import ServerVersion
 from .graph_object import Graph
@@ -19,50 +21,56 @@ class GraphAlphaSampleRunner(IllegalAttrChecker):
 
 
 class GraphSampleRunner(IllegalAttrChecker):
-    @property
+    @cached_property
     def rwr(self) -> "RWRRunner":
         return RWRRunner(self._query_runner, self._namespace + ".rwr", self._server_version)
 
-    @property
+    @cached_property
     def cnarw(self) -> "CNARWRunner":
         return CNARWRunner(self._query_runner, self._namespace + ".cnarw", self._server_version)
 
 
 class RWRRunner(IllegalAttrChecker):
+    def __init__(self, query_runner: QueryRunner, namespace: str, server_version: ServerVersion):
+        super().__init__(query_runner, namespace, server_version)
+        self._query = f"CALL {namespace}($graph_name, $from_graph_name, $config)"
+
     @compatible_with("construct", min_inclusive=ServerVersion(2, 2, 0))
     @from_graph_type_check
     def __call__(self, graph_name: str, from_G: Graph, **config: Any) -> GraphCreateResult:
-        query = f"CALL {self._namespace}($graph_name, $from_graph_name, $config)"
         params = {
             "graph_name": graph_name,
             "from_graph_name": from_G.name(),
             "config": config,
         }
 
-        result = self._query_runner.run_query_with_logging(query, params).squeeze()
+        result = self._query_runner.run_query_with_logging(self._query, params).squeeze()
 
         return GraphCreateResult(Graph(graph_name, self._query_runner, self._server_version), result)
 
 
 class CNARWRunner(IllegalAttrChecker):
+    def __init__(self, query_runner: QueryRunner, namespace: str, server_version: ServerVersion):
+        super().__init__(query_runner, namespace, server_version)
+        self._query = f"CALL {namespace}($graph_name, $from_graph_name, $config)"
+
     @compatible_with("construct", min_inclusive=ServerVersion(2, 4, 0))
     @from_graph_type_check
     def __call__(self, graph_name: str, from_G: Graph, **config: Any) -> GraphCreateResult:
-        query = f"CALL {self._namespace}($graph_name, $from_graph_name, $config)"
         params = {
             "graph_name": graph_name,
             "from_graph_name": from_G.name(),
             "config": config,
         }
 
-        result = self._query_runner.run_query_with_logging(query, params).squeeze()
+        result = self._query_runner.run_query_with_logging(self._query, params).squeeze()
 
         return GraphCreateResult(Graph(graph_name, self._query_runner, self._server_version), result)
 
     def estimate(self, from_G: Graph, **config: Any) -> "Series[Any]":
-        self._namespace += ".estimate"
+        namespace = self._namespace + ".estimate"
         result = self._query_runner.run_query(
-            f"CALL {self._namespace}($from_graph_name, $config)",
+            f"CALL {namespace}($from_graph_name, $config)",
             {
                 "from_graph_name": from_G.name(),
                 "config": config,
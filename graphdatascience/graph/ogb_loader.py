@@ -1,12 +1,16 @@
 import logging
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from warnings import warn
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+from neo4j import __version__ as neo4j_driver_version
 
 from ..error.client_only_endpoint import client_only_endpoint
 from ..error.illegal_attr_checker import IllegalAttrChecker
@@ -21,6 +25,37 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import Protocol, TypedDict
 
+is_neo4j_4_driver = ServerVersion.from_string(neo4j_driver_version) < ServerVersion(5, 0, 0)
+
+
+@lru_cache(maxsize=None)
+def _ogb_dataset_class(module: str, name: str) -> Any:
+    # importing ogb pulls in heavy dependencies, so only look up the dataset class once
+    try:
+        return getattr(import_module(f"ogb.{module}"), name)
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "This feature requires OGB support. "
+            "You can add OGB support by running `pip install graphdatascience[ogb]`"
+        )
+
+
+def _repeated(value: str, count: int) -> npt.NDArray[Any]:
+    # np.full would convert the value to a numpy string first, and create a separate python string for every element
+    array = np.empty(count, dtype=object)
+    array[:] = sys.intern(value)
+
+    return array
+
+
+def _feature_rows(features: npt.NDArray[np.float64]) -> List[Any]:
+    if is_neo4j_4_driver:
+        # ndarrays are not supported as query parameters in neo4j 4
+        return features.tolist()  # type: ignore
+
+    # the rows are views on the feature matrix, so no python float is created per feature
+    return list(features)
+
 
 class _HomogeneousOGBGraphBase(TypedDict):
     edge_index: npt.NDArray[np.int64]
@@ -98,6 +133,17 @@ class OGBLoader(UncallableNamespace, IllegalAttrChecker, ABC):
 
         return Graph(graph_name, self._query_runner, self._server_version)
 
+    @staticmethod
+    def _build_concurrently(
+        build_nodes: Callable[[], List[pd.DataFrame]], build_rels: Callable[[], List[pd.DataFrame]]
+    ) -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
+        # node and relationship data are independent and mostly prepared by numpy, which releases the GIL
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            nodes_future = executor.submit(build_nodes)
+            rels_future = executor.submit(build_rels)
+
+            return nodes_future.result(), rels_future.result()
+
 
 class OGBNLoader(OGBLoader):
     def _parse_homogeneous(self, dataset: HomogeneousOGBNDataset) -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
@@ -106,42 +152,48 @@ class OGBNLoader(OGBLoader):
         if dataset.meta_info["has_edge_attr"] == "True":
             warn("Edge features are not supported and will not be loaded")
 
-        self._logger.info("Preparing node data for transfer to server...")
-
-        node_count = graph["num_nodes"]
-
-        node_dict: Dict[str, List[Any]] = {
-            "nodeId": list(range(node_count)),
-        }
-        if "node_feat" in graph and graph["node_feat"] is not None:
-            node_dict["features"] = graph["node_feat"].tolist()
-
-        if len(dataset.labels[0]) == 1:
-            node_dict["classLabel"] = [cl[0] for cl in dataset.labels]
-        else:
-            node_dict["classLabel"] = dataset.labels.tolist()
-
-        split = dataset.get_idx_split()
-        node_labels = ["Train" for _ in range(node_count)]
-        for node_id in split["valid"]:
-            node_labels[node_id] = "Valid"
-        for node_id in split["test"]:
-            node_labels[node_id] = "Test"
-        node_dict["labels"] = node_labels
+        def build_nodes() -> List[pd.DataFrame]:
+            self._logger.info("Preparing node data for transfer to server...")
 
-        nodes = pd.DataFrame(node_dict)
+            node_count = graph["num_nodes"]
 
-        self._logger.info("Preparing relationship data for transfer to server...")
-
-        relationships = pd.DataFrame(
-            {
-                "sourceNodeId": graph["edge_index"][0],
-                "targetNodeId": graph["edge_index"][1],
-                "relationshipType": "R",
+            node_dict: Dict[str, Any] = {
+                "nodeId": np.arange(node_count, dtype=np.int64),
             }
-        )
+            if "node_feat" in graph and graph["node_feat"] is not None:
+                node_dict["features"] = _feature_rows(graph["node_feat"])
+
+            if dataset.labels.shape[1] == 1:
+                node_dict["classLabel"] = dataset.labels[:, 0]
+            else:
+                node_dict["classLabel"] = dataset.labels.tolist()
+
+            split = dataset.get_idx_split()
+            node_labels = _repeated("Train", node_count)
+            node_labels[split["valid"]] = "Valid"
+            node_labels[split["test"]] = "Test"
+            node_dict["labels"] = node_labels
+
+            return [pd.DataFrame(node_dict, copy=False)]
+
+        def build_rels() -> List[pd.DataFrame]:
+            self._logger.info("Preparing relationship data for transfer to server...")
+
+            rel_types = _repeated("R", graph["edge_index"].shape[1])
+
+            # the rows of the edge index are contiguous, so they can back the id columns without being copied
+            relationships = pd.DataFrame(
+                {
+                    "sourceNodeId": graph["edge_index"][0],
+                    "targetNodeId": graph["edge_index"][1],
+                    "relationshipType": rel_types,
+                },
+                copy=False,
+            )
+
+            return [relationships]
 
-        return [nodes], [relationships]
+        return self._build_concurrently(build_nodes, build_rels)
 
     def _parse_heterogeneous(self, dataset: HeterogeneousOGBNDataset) -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
         graph: HeterogeneousOGBGraph = dataset.graph
@@ -150,60 +202,73 @@ class OGBNLoader(OGBLoader):
         if dataset.meta_info["has_edge_attr"] == "True":
             warn("Edge features are not supported and will not be loaded")
 
-        self._logger.info("Preparing node data for transfer to server...")
-
         node_features = {}
         if "node_feat_dict" in graph and graph["node_feat_dict"] is not None:
             node_features = graph["node_feat_dict"]
 
-        split = dataset.get_idx_split()
         node_id_offsets = {}
         current_offset = 0
-        nodes = []
-
         for node_label, node_count in graph["num_nodes_dict"].items():
-            node_labels: Union[str, List[List[str]]] = node_label
-            if node_label in split["train"]:
-                node_labels = [[node_label, "Train"] for _ in range(node_count)]
-                for node_id in split["valid"][node_label]:
-                    node_labels[node_id] = [node_label, "Valid"]
-                for node_id in split["test"][node_label]:
-                    node_labels[node_id] = [node_label, "Test"]
+            node_id_offsets[node_label] = current_offset
+            current_offset += node_count
 
-            node_dict = {
-                "nodeId": range(current_offset, current_offset + node_count),
-                "labels": node_labels,
-            }
+        def build_nodes() -> List[pd.DataFrame]:
+            self._logger.info("Preparing node data for transfer to server...")
 
-            if node_label in node_features:
-                node_dict["features"] = node_features[node_label].tolist()
+            split = dataset.get_idx_split()
+            nodes = []
 
-            if node_label in class_labels:
-                if len(class_labels[node_label]) == 1:
-                    node_dict["classLabel"] = [cl[0] for cl in class_labels[node_label]]
-                else:
-                    node_dict["classLabel"] = class_labels[node_label].tolist()
+            for node_label, node_count in graph["num_nodes_dict"].items():
+                node_labels: Union[str, npt.NDArray[Any]] = node_label
+                if node_label in split["train"]:
+                    # nodes carry both their type and their split as labels,
+                    # so all nodes of a split can share the same (never mutated) label list
+                    split_label_lists = np.empty(3, dtype=object)
+                    for split_code, split_name in enumerate(["Train", "Valid", "Test"]):
+                        split_label_lists[split_code] = [node_label, split_name]
 
-            node_id_offsets[node_label] = current_offset
-            current_offset += node_count
+                    split_codes = np.zeros(node_count, dtype=np.int8)
+                    split_codes[np.asarray(split["valid"][node_label], dtype=np.int64)] = 1
+                    split_codes[np.asarray(split["test"][node_label], dtype=np.int64)] = 2
+                    node_labels = split_label_lists[split_codes]
 
-            nodes.append(pd.DataFrame(node_dict))
+                offset = node_id_offsets[node_label]
+                node_dict: Dict[str, Any] = {
+                    "nodeId": np.arange(offset, offset + node_count, dtype=np.int64),
+                    "labels": node_labels,
+                }
 
-        self._logger.info("Preparing relationship data for transfer to server...")
+                if node_label in node_features:
+                    node_dict["features"] = _feature_rows(node_features[node_label])
 
-        rels = []
-        for rel_triple, edge_index in graph["edge_index_dict"].items():
-            source_label, rel_type, target_label = rel_triple
+                if node_label in class_labels:
+                    if class_labels[node_label].shape[1] == 1:
+                        node_dict["classLabel"] = class_labels[node_label][:, 0]
+                    else:
+                        node_dict["classLabel"] = class_labels[node_label].tolist()
 
-            rel_dict = {
-                "sourceNodeId": edge_index[0] + node_id_offsets[source_label],
-                "targetNodeId": edge_index[1] + node_id_offsets[target_label],
-                "relationshipType": rel_type,
-            }
+                nodes.append(pd.DataFrame(node_dict, copy=False))
+
+            return nodes
+
+        def build_rels() -> List[pd.DataFrame]:
+            self._logger.info("Preparing relationship data for transfer to server...")
 
-            rels.append(pd.DataFrame(rel_dict))
+            rels = []
+            for rel_triple, edge_index in graph["edge_index_dict"].items():
+                source_label, rel_type, target_label = rel_triple
 
-        return nodes, rels
+                rel_dict = {
+                    "sourceNodeId": edge_index[0] + node_id_offsets[source_label],
+                    "targetNodeId": edge_index[1] + node_id_offsets[target_label],
+                    "relationshipType": rel_type,
+                }
+
+                rels.append(pd.DataFrame(rel_dict, copy=False))
+
+            return rels
+
+        return self._build_concurrently(build_nodes, build_rels)
 
     @client_only_endpoint("gds.graph.ogbn")
     @compatible_with("load", min_inclusive=ServerVersion(2, 1, 0))
@@ -214,15 +279,7 @@ class OGBNLoader(OGBLoader):
         graph_name: Optional[str] = None,
         concurrency: int = 4,
     ) -> Graph:
-        try:
-            from ogb.nodeproppred import NodePropPredDataset
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError(
-                "This feature requires OGB support. "
-                "You can add OGB support by running `pip install graphdatascience[ogb]`"
-            )
-
-        dataset = NodePropPredDataset(name=dataset_name, root=dataset_root_path)
+        dataset = _ogb_dataset_class("nodeproppred", "NodePropPredDataset")(name=dataset_name, root=dataset_root_path)
 
         if dataset.is_hetero:
             nodes, rels = self._parse_heterogeneous(dataset)
@@ -242,95 +299,105 @@ class OGBLLoader(OGBLoader):
         if dataset.meta_info["has_edge_attr"] == "True":
             warn("Edge features are not supported and will not be loaded")
 
-        self._logger.info("Preparing node data for transfer to server...")
+        def build_nodes() -> List[pd.DataFrame]:
+            self._logger.info("Preparing node data for transfer to server...")
 
-        node_dict = {
-            "nodeId": range(graph["num_nodes"]),
-            "labels": "N",
-        }
-        if "node_feat" in graph and graph["node_feat"] is not None:
-            node_dict["features"] = graph["node_feat"].tolist()
-        nodes = pd.DataFrame(node_dict)
+            node_dict = {
+                "nodeId": np.arange(graph["num_nodes"], dtype=np.int64),
+                "labels": "N",
+            }
+            if "node_feat" in graph and graph["node_feat"] is not None:
+                node_dict["features"] = _feature_rows(graph["node_feat"])
 
-        self._logger.info("Preparing relationship data for transfer to server...")
+            return [pd.DataFrame(node_dict, copy=False)]
 
-        source_ids: List[int] = []
-        target_ids: List[int] = []
-        rel_types: List[str] = []
-        split = dataset.get_edge_split()
+        def build_rels() -> List[pd.DataFrame]:
+            self._logger.info("Preparing relationship data for transfer to server...")
 
-        self._load_homogenous_ogbl_relationships(dataset.name, split, source_ids, target_ids, rel_types)
+            split = dataset.get_edge_split()
 
-        relationships = pd.DataFrame(
-            {"sourceNodeId": source_ids, "targetNodeId": target_ids, "relationshipType": rel_types}
-        )
+            source_ids, target_ids, rel_types = self._load_homogenous_ogbl_relationships(dataset.name, split)
+
+            relationships = pd.DataFrame(
+                {"sourceNodeId": source_ids, "targetNodeId": target_ids, "relationshipType": rel_types}, copy=False
+            )
+
+            return [relationships]
 
-        return [nodes], [relationships]
+        return self._build_concurrently(build_nodes, build_rels)
 
-    def _parse_heterogeneous(self, dataset: HeterogeneousOGBLDataset) -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
+    def _parse_heterogeneous(
+        self, dataset: HeterogeneousOGBLDataset, concurrency: int = 1
+    ) -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
         graph: HeterogeneousOGBGraph = dataset.graph
 
         if dataset.meta_info["has_edge_attr"] == "True":
             warn("Edge features are not supported and will not be loaded")
 
-        self._logger.info("Preparing node data for transfer to server...")
-
         node_features = {}
         if "node_feat_dict" in graph and graph["node_feat_dict"] is not None:
             node_features = graph["node_feat_dict"]
 
         node_id_offsets = {}
         current_offset = 0
-        nodes = []
         for node_label, node_count in graph["num_nodes_dict"].items():
-            node_dict = {
-                "nodeId": range(current_offset, current_offset + node_count),
+            node_id_offsets[node_label] = current_offset
+            current_offset += node_count
+
+        def build_nodes(node_label: str, node_count: int) -> pd.DataFrame:
+            offset = node_id_offsets[node_label]
+            node_dict: Dict[str, Any] = {
+                "nodeId": np.arange(offset, offset + node_count, dtype=np.int64),
                 "labels": node_label,
             }
 
             if node_label in node_features:
-                node_dict["features"] = node_features[node_label].tolist()
-
-            node_id_offsets[node_label] = current_offset
-            current_offset += node_count
+                node_dict["features"] = _feature_rows(node_features[node_label])
 
-            nodes.append(pd.DataFrame(node_dict))
-
-        self._logger.info("Preparing relationship data for transfer to server...")
+            return pd.DataFrame(node_dict, copy=False)
 
         split = dataset.get_edge_split()
         available_rel_types = list(graph["edge_index_dict"].keys())
-        rels = []
-        for set_type, edges in split.items():
-            source_labels = edges["head_type"]
-            target_labels = edges["tail_type"]
-            source_ids = edges["head"]
-            target_ids = edges["tail"]
-            class_labels = edges["relation"]
-            rel_types = []
-
-            for i, class_label in enumerate(class_labels):
-                source_label, edge_type, target_label = available_rel_types[class_label]
-                assert source_labels[i] == source_label
-                assert target_labels[i] == target_label
-
-                source_ids[i] += node_id_offsets[edges["head_type"][i]]
-                target_ids[i] += node_id_offsets[edges["tail_type"][i]]
-
-                rel_types.append(f"{edge_type}_{set_type.upper()}")
-
-            rels.append(
-                pd.DataFrame(
-                    {
-                        "sourceNodeId": source_ids,
-                        "targetNodeId": target_ids,
-                        "relationshipType": rel_types,
-                        "classLabel": class_labels,
-                    }
-                )
+        # lookups from the class label of an edge to the properties of its relationship type
+        # python string labels compare much faster than converting all edge labels to numpy strings
+        source_labels_by_class = np.array([source_label for source_label, _, _ in available_rel_types], dtype=object)
+        target_labels_by_class = np.array([target_label for _, _, target_label in available_rel_types], dtype=object)
+        source_offsets_by_class = np.array([node_id_offsets[label] for label in source_labels_by_class])
+        target_offsets_by_class = np.array([node_id_offsets[label] for label in target_labels_by_class])
+
+        def build_rels(set_type: str, edges: Dict[str, Any]) -> pd.DataFrame:
+            class_labels = np.asarray(edges["relation"], dtype=np.int64)
+
+            assert np.array_equal(source_labels_by_class[class_labels], np.asarray(edges["head_type"], dtype=object))
+            assert np.array_equal(target_labels_by_class[class_labels], np.asarray(edges["tail_type"], dtype=object))
+
+            source_ids = np.asarray(edges["head"], dtype=np.int64) + source_offsets_by_class[class_labels]
+            target_ids = np.asarray(edges["tail"], dtype=np.int64) + target_offsets_by_class[class_labels]
+
+            rel_types_by_class = np.array(
+                [f"{edge_type}_{set_type.upper()}" for _, edge_type, _ in available_rel_types], dtype=object
+            )
+            rel_types = rel_types_by_class[class_labels]
+
+            return pd.DataFrame(
+                {
+                    "sourceNodeId": source_ids,
+                    "targetNodeId": target_ids,
+                    "relationshipType": rel_types,
+                    "classLabel": class_labels,
+                },
+                copy=False,
             )
 
-        return nodes, rels
+        # the frames are independent and mostly built by numpy, which releases the GIL
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            self._logger.info("Preparing node and relationship data for transfer to server...")
+            num_nodes_dict = graph["num_nodes_dict"]
+            # both phases are submitted before waiting for any result, so that they can overlap
+            node_results = executor.map(build_nodes, num_nodes_dict.keys(), num_nodes_dict.values())
+            rel_results = executor.map(build_rels, split.keys(), split.values())
+
+            return list(node_results), list(rel_results)
 
     @client_only_endpoint("gds.graph.ogbl")
     @compatible_with("load", min_inclusive=ServerVersion(2, 1, 0))
@@ -341,18 +408,10 @@ class OGBLLoader(OGBLoader):
         graph_name: Optional[str] = None,
         concurrency: int = 4,
     ) -> Graph:
-        try:
-            from ogb.linkproppred import LinkPropPredDataset
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError(
-                "This feature requires OGB support. "
-                "You can add OGB support by running `pip install graphdatascience[ogb]`"
-            )
-
-        dataset = LinkPropPredDataset(name=dataset_name, root=dataset_root_path)
+        dataset = _ogb_dataset_class("linkproppred", "LinkPropPredDataset")(name=dataset_name, root=dataset_root_path)
 
         if dataset.is_hetero:
-            nodes, rels = self._parse_heterogeneous(dataset)
+            nodes, rels = self._parse_heterogeneous(dataset, concurrency)
         else:
             nodes, rels = self._parse_homogeneous(dataset)
 
@@ -365,31 +424,31 @@ class OGBLLoader(OGBLoader):
         self,
         dataset_name: str,
         split: Dict[str, Any],
-        source_ids: List[int],
-        target_ids: List[int],
-        rel_types: List[str],
-    ) -> None:
+    ) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[Any]]:
+        source_ids: List[npt.NDArray[np.int64]] = []
+        target_ids: List[npt.NDArray[np.int64]] = []
+        rel_types: List[npt.NDArray[Any]] = []
+
         if dataset_name == "ogbl-wikikg2":
             for set_type, entity in split.items():
                 rel_suffix = f"{set_type.upper()}"
-                for i in range(len(entity["relation"])):
-                    source_ids.append(entity["head"][i])
-                    target_ids.append(entity["tail"][i])
-                    rel_types.append(f"{entity['relation'][i]}_{rel_suffix}")
-                    # This dataset is effectively heterogeneous.
-                    # There are 1000 negative edges for each positive edge which is too many.
-                    # Do not load negative edges just like other heterogeneous datasets.
+                # format each distinct relation once and scatter the results to the edges
+                relations, relation_idx = np.unique(entity["relation"], return_inverse=True)
+                source_ids.append(entity["head"])
+                target_ids.append(entity["tail"])
+                rel_types.append(np.array([f"{r}_{rel_suffix}" for r in relations], dtype=object)[relation_idx])
+                # This dataset is effectively heterogeneous.
+                # There are 1000 negative edges for each positive edge which is too many.
+                # Do not load negative edges just like other heterogeneous datasets.
         else:
             for set_type, edges in split.items():
                 if "edge" in edges:
-                    rel_type = f"{set_type.upper()}_POS"
-                    for source_id, target_id in edges["edge"]:
-                        source_ids.append(source_id)
-                        target_ids.append(target_id)
-                        rel_types.append(rel_type)
+                    source_ids.append(edges["edge"][:, 0])
+                    target_ids.append(edges["edge"][:, 1])
+                    rel_types.append(_repeated(f"{set_type.upper()}_POS", len(edges["edge"])))
                 if "edge_neg" in edges:
-                    rel_type = f"{set_type.upper()}_NEG"
-                    for source_id, target_id in edges["edge_neg"]:
-                        source_ids.append(source_id)
-                        target_ids.append(target_id)
-                        rel_types.append(rel_type)
+                    source_ids.append(edges["edge_neg"][:, 0])
+                    target_ids.append(edges["edge_neg"][:, 1])
+                    rel_types.append(_repeated(f"{set_type.upper()}_NEG", len(edges["edge_neg"])))
+
+        return np.concatenate(source_ids), np.concatenate(target_ids), np.concatenate(rel_types)
@@ -6,12 +6,12 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import numpy
+import pyarrow
 import pyarrow.flight as flight
-from pandas import DataFrame
 from pyarrow import Table
 from tqdm.auto import tqdm
 
-from .graph_constructor import GraphConstructor
+from .graph_constructor import GraphConstructor, GraphData
 
 
 class ArrowGraphConstructor(GraphConstructor):
@@ -34,7 +34,7 @@ class ArrowGraphConstructor(GraphConstructor):
         self._chunk_size = chunk_size
         self._min_batch_size = chunk_size * 10
 
-    def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
+    def run(self, node_dfs: List[GraphData], relationship_dfs: List[GraphData]) -> None:
         try:
             config: Dict[str, Any] = {
                 "name": self._graph_name,
@@ -61,11 +61,19 @@ class ArrowGraphConstructor(GraphConstructor):
 
             raise e
 
-    def _partition_dfs(self, dfs: List[DataFrame]) -> List[DataFrame]:
-        partitioned_dfs: List[DataFrame] = []
+    def _partition_dfs(self, dfs: List[GraphData]) -> List[GraphData]:
+        partitioned_dfs: List[GraphData] = []
 
         for df in dfs:
             num_rows = df.shape[0]
+
+            if isinstance(df, Table):
+                # slicing a table is zero-copy
+                partitioned_dfs += [
+                    df.slice(offset, self._min_batch_size) for offset in range(0, num_rows, self._min_batch_size)
+                ]
+                continue
+
             num_batches = math.ceil(num_rows / self._min_batch_size)
 
             # pandas 2.1.0 deprecates swapaxes, but numpy did not catch up yet.
@@ -76,7 +84,7 @@ class ArrowGraphConstructor(GraphConstructor):
                     + r"Please use 'DataFrame.transpose' instead.$"
                 ),
             )
-            partitioned_dfs += numpy.array_split(df, num_batches)  # type: ignore
+            partitioned_dfs += numpy.array_split(df, num_batches)
 
         return partitioned_dfs
 
@@ -89,8 +97,8 @@ class ArrowGraphConstructor(GraphConstructor):
 
         json.loads(collected_result[0].body.to_pybytes().decode())
 
-    def _send_df(self, df: DataFrame, entity_type: str, pbar: tqdm) -> None:
-        table = Table.from_pandas(df)
+    def _send_df(self, df: GraphData, entity_type: str, pbar: tqdm) -> None:
+        table = self._decode_dictionaries(df if isinstance(df, Table) else Table.from_pandas(df))
         batches = table.to_batches(self._chunk_size)
         flight_descriptor = {"name": self._graph_name, "entity_type": entity_type}
 
@@ -104,7 +112,16 @@ class ArrowGraphConstructor(GraphConstructor):
                 writer.write_batch(partition)
                 pbar.update(partition.num_rows)
 
-    def _send_dfs(self, dfs: List[DataFrame], entity_type: str) -> None:
+    @staticmethod
+    def _decode_dictionaries(table: Table) -> Table:
+        # pandas categoricals are converted to dictionary encoded columns, but the server expects plain values
+        for i, field in enumerate(table.schema):
+            if pyarrow.types.is_dictionary(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+
+        return table
+
+    def _send_dfs(self, dfs: List[GraphData], entity_type: str) -> None:
         desc = "Uploading Nodes" if entity_type == "node" else "Uploading Relationships"
         pbar = tqdm(total=sum([df.shape[0] for df in dfs]), unit="Records", desc=desc)
 
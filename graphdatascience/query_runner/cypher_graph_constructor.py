@@ -5,13 +5,23 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
+import pyarrow
 from pandas import DataFrame, concat
+from pyarrow import Table
 
-from .graph_constructor import GraphConstructor
+from .graph_constructor import GraphConstructor, GraphData
 from .query_runner import QueryRunner
 from graphdatascience.server_version.server_version import ServerVersion
 
 
+def _is_list_type(data_type: pyarrow.DataType) -> bool:
+    return bool(
+        pyarrow.types.is_list(data_type)
+        or pyarrow.types.is_large_list(data_type)
+        or pyarrow.types.is_fixed_size_list(data_type)
+    )
+
+
 class CypherProjectionApi:
     RELATIONSHIP_TYPE = "relationshipType"
     SOURCE_NODE_LABEL = "sourceNodeLabels"
@@ -66,7 +76,10 @@ class CypherGraphConstructor(GraphConstructor):
         self._server_version = server_version
         self._undirected_relationship_types = undirected_relationship_types
 
-    def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
+    def run(self, node_dfs: List[GraphData], relationship_dfs: List[GraphData]) -> None:
+        node_dfs = [self._to_pandas(df) for df in node_dfs]
+        relationship_dfs = [self._to_pandas(df) for df in relationship_dfs]
+
         if self._should_warn_about_arrow_missing():
             warnings.warn(
                 "GDS Enterprise users can use Apache Arrow for fast graph construction; please see the documentation "
@@ -102,6 +115,21 @@ class CypherGraphConstructor(GraphConstructor):
                 node_df, rel_df
             )
 
+    @staticmethod
+    def _to_pandas(df: GraphData) -> DataFrame:
+        if not isinstance(df, Table):
+            return df
+
+        # list columns would be converted to ndarrays which are not supported as parameters by all neo4j drivers,
+        # so only the other columns go through pandas' conversion and list columns are converted to python lists
+        list_columns = [(i, field.name) for i, field in enumerate(df.schema) if _is_list_type(field.type)]
+
+        pandas_df: DataFrame = df.drop([name for _, name in list_columns]).to_pandas(split_blocks=True)
+        for i, name in list_columns:
+            pandas_df.insert(i, name, df.column(name).to_pylist())
+
+        return pandas_df
+
     def _should_warn_about_arrow_missing(self) -> bool:
         try:
             license: str = self._query_runner.run_query(
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Union
 
 from pandas import DataFrame
+from pyarrow import Table
+
+# Graph data can be given either as pandas DataFrames or as pyarrow Tables
+GraphData = Union[DataFrame, Table]
 
 
 class GraphConstructor(ABC):
     @abstractmethod
-    def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
+    def run(self, node_dfs: List[GraphData], relationship_dfs: List[GraphData]) -> None:
         pass
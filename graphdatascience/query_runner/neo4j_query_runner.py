@@ -134,7 +134,9 @@ class Neo4jQueryRunner(QueryRunner):
             try:
                 tier = "beta." if self._server_version < ServerVersion(2, 5, 0) else ""
                 progress = self.run_query(
-                    f"CALL gds.{tier}listProgress('{job_id}') YIELD taskName, progress", database=database
+                    f"CALL gds.{tier}listProgress($job_id) YIELD taskName, progress",
+                    {"job_id": job_id},
+                    database=database,
                 )
             except Exception as e:
                 # Do nothing if the procedure either:
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Optional
 
 from pandas import DataFrame, Series
@@ -11,30 +12,41 @@ from graphdatascience.server_version.server_version import ServerVersion
 
 
 class DebugProcRunner(UncallableNamespace, IllegalAttrChecker):
-    def sysInfo(self) -> "Series[Any]":
-        self._namespace += ".sysInfo"
-        query = f"CALL {self._namespace}()"
+    # The runner is cached on `gds.debug`, so the queries are only built once
+    @cached_property
+    def _sys_info_query(self) -> str:
+        return f"CALL {self._namespace}.sysInfo()"
 
-        return self._query_runner.run_query(query).squeeze()  # type: ignore
+    @cached_property
+    def _arrow_query(self) -> str:
+        return f"CALL {self._namespace}.arrow()"
 
-    def arrow(self) -> "Series[Any]":
-        self._namespace += ".arrow"
-        query = f"CALL {self._namespace}()"
+    def sysInfo(self) -> "Series[Any]":
+        return self._query_runner.run_query(self._sys_info_query).squeeze()  # type: ignore
 
-        return self._query_runner.run_query(query).squeeze()  # type: ignore
+    def arrow(self) -> "Series[Any]":
+        return self._query_runner.run_query(self._arrow_query).squeeze()  # type: ignore
 
 
 class LicenseProcRunner(UncallableNamespace, IllegalAttrChecker):
-    def state(self) -> "Series[Any]":
-        self._namespace += ".state"
-        query = f"CALL {self._namespace}()"
+    # The runner is cached on `gds.license`, so the query is only built once
+    @cached_property
+    def _state_query(self) -> str:
+        return f"CALL {self._namespace}.state()"
 
-        return self._query_runner.run_query(query).squeeze()  # type: ignore
+    def state(self) -> "Series[Any]":
+        return self._query_runner.run_query(self._state_query).squeeze()  # type: ignore
 
 
 class DirectSystemEndpoints(CallerBase):
+    # The license state does not change during a session, so we only query it once.
+    _is_licensed: Optional[bool] = None
+
     @client_only_endpoint("gds")
     def is_licensed(self) -> bool:
+        if self._is_licensed is not None:
+            return self._is_licensed
+
         if self._server_version >= ServerVersion(2, 5, 0):
             query = "RETURN gds.isLicensed()"
         else:
@@ -61,13 +73,15 @@ class DirectSystemEndpoints(CallerBase):
             else:
                 raise e
 
+        self._is_licensed = isLicensed
+
         return isLicensed
 
-    @property
+    @cached_property
     def license(self) -> LicenseProcRunner:
         return LicenseProcRunner(self._query_runner, f"{self._namespace}.license", self._server_version)
 
-    @property
+    @cached_property
     def debug(self) -> DebugProcRunner:
         return DebugProcRunner(self._query_runner, f"{self._namespace}.debug", self._server_version)
 
@@ -100,13 +114,13 @@ class DirectSystemEndpoints(CallerBase):
 
 class SystemBetaEndpoints(CallerBase):
     def listProgress(self, job_id: Optional[str] = None) -> DataFrame:
-        self._namespace += ".listProgress"
+        namespace = self._namespace + ".listProgress"
 
         if job_id:
-            query = f"CALL {self._namespace}($job_id)"
+            query = f"CALL {namespace}($job_id)"
             params = {"job_id": job_id}
         else:
-            query = f"CALL {self._namespace}()"
+            query = f"CALL {namespace}()"
             params = {}
 
         return self._query_runner.run_query(query, params)
@@ -114,25 +128,25 @@ class SystemBetaEndpoints(CallerBase):
 
 class SystemAlphaEndpoints(CallerBase):
     def userLog(self) -> DataFrame:
-        self._namespace += ".userLog"
-        query = f"CALL {self._namespace}()"
+        namespace = self._namespace + ".userLog"
+        query = f"CALL {namespace}()"
 
         return self._query_runner.run_query(query)
 
     def systemMonitor(self) -> "Series[Any]":
-        self._namespace += ".systemMonitor"
-        query = f"CALL {self._namespace}()"
+        namespace = self._namespace + ".systemMonitor"
+        query = f"CALL {namespace}()"
 
         return self._query_runner.run_query(query).squeeze()  # type: ignore
 
     def backup(self, **config: Any) -> DataFrame:
-        self._namespace += ".backup"
-        query = f"CALL {self._namespace}($config)"
+        namespace = self._namespace + ".backup"
+        query = f"CALL {namespace}($config)"
 
         return self._query_runner.run_query(query, {"config": config})
 
     def restore(self, **config: Any) -> DataFrame:
-        self._namespace += ".restore"
-        query = f"CALL {self._namespace}($config)"
+        namespace = self._namespace + ".restore"
+        query = f"CALL {namespace}($config)"
 
         return self._query_runner.run_query(query, {"config": config})
@@ -1,8 +1,10 @@
+import pyarrow
 import pytest
 from pandas import DataFrame
 
 from .conftest import CollectingQueryRunner
 from graphdatascience.graph_data_science import GraphDataScience
+from graphdatascience.query_runner.arrow_graph_constructor import ArrowGraphConstructor
 from graphdatascience.server_version.server_version import ServerVersion
 
 
@@ -274,3 +276,83 @@ def test_nodes_graph(gds: GraphDataScience, runner: CollectingQueryRunner) -> No
     other_query = runner.last_query()
 
     assert query == other_query
+
+
+def test_construct_ignores_empty_dfs(gds: GraphDataScience, runner: CollectingQueryRunner) -> None:
+    gds.graph.construct("hello", nodes=DataFrame({"nodeId": [0, 1]}), concurrency=2)
+
+    query = runner.last_query()
+
+    gds.graph.construct(
+        "hello",
+        nodes=[DataFrame({"nodeId": [0, 1]}), DataFrame({"nodeId": []})],
+        relationships=DataFrame({"sourceNodeId": [], "targetNodeId": []}),
+        concurrency=2,
+    )
+
+    other_query = runner.last_query()
+
+    assert query == other_query
+
+
+def test_construct_from_arrow_tables(gds: GraphDataScience, runner: CollectingQueryRunner) -> None:
+    nodes = {"nodeId": [0, 1], "labels": ["A", "B"], "features": [[0.1, 0.2], [0.3, 0.4]]}
+    relationships = {"sourceNodeId": [0, 1], "targetNodeId": [1, 0], "relationshipType": ["REL", "REL2"]}
+
+    gds.graph.construct("hello", DataFrame(nodes), DataFrame(relationships), concurrency=2)
+
+    query = runner.last_query()
+    params = runner.last_params()
+
+    gds.graph.construct("hello", pyarrow.table(nodes), pyarrow.table(relationships), concurrency=2)
+
+    assert runner.last_query() == query
+    assert runner.last_params() == params
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+@pytest.mark.parametrize(
+    "list_type",
+    [pyarrow.list_(pyarrow.float64()), pyarrow.large_list(pyarrow.float64()), pyarrow.list_(pyarrow.float64(), 2)],
+)
+def test_construct_from_arrow_tables_with_list_columns(
+    gds: GraphDataScience, runner: CollectingQueryRunner, list_type: pyarrow.DataType
+) -> None:
+    features = [[0.1, 0.2], [0.3, 0.4]]
+    nodes = pyarrow.table(
+        {"nodeId": [0, 1], "features": pyarrow.array(features, type=list_type), "labels": ["A", "B"]}
+    )
+
+    relationships = pyarrow.table({"sourceNodeId": [0], "targetNodeId": [1], "relationshipType": ["REL"]})
+
+    gds.graph.construct("hello", nodes, relationships, concurrency=2)
+
+    sent_nodes = runner.last_params()["nodes"]
+    assert [node[1] for node in sent_nodes] == features
+    assert all(isinstance(node[1], list) for node in sent_nodes)
+
+
+def test_arrow_partition_tables() -> None:
+    # The flight client is not used for partitioning
+    constructor = ArrowGraphConstructor("db", "hello", None, 2, None, chunk_size=2)
+    table = pyarrow.table({"nodeId": range(45)})
+
+    partitions = constructor._partition_dfs([table, pyarrow.table({"nodeId": [0]})])
+
+    assert [partition.num_rows for partition in partitions] == [20, 20, 5, 1]
+    assert pyarrow.concat_tables(partitions[:3]).equals(table)
+
+
+def test_arrow_decode_dictionaries() -> None:
+    table = pyarrow.table(
+        {
+            "nodeId": [0, 1, 2],
+            "labels": pyarrow.array(["A", "B", "A"]).dictionary_encode(),
+        }
+    )
+
+    decoded = ArrowGraphConstructor._decode_dictionaries(table)
+
+    assert decoded.schema.field("labels").type == pyarrow.string()
+    assert decoded.column("labels").to_pylist() == ["A", "B", "A"]
+    assert decoded.column("nodeId").equals(table.column("nodeId"))
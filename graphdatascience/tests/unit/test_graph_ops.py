@@ -2,6 +2,7 @@ import pytest
 from pandas import DataFrame
 
 from .conftest import CollectingQueryRunner
+from graphdatascience.graph.graph_proc_runner import _io_thread_count
 from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.server_version.server_version import ServerVersion
 
@@ -110,6 +111,39 @@ def test_graph_exists(runner: CollectingQueryRunner, gds: GraphDataScience) -> N
     assert runner.last_params() == {"graph_name": "g"}
 
 
+def test_graph_runner_reuse(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    graph_runner = gds.graph
+
+    graph_runner.exists("g")
+    graph_runner.exists("g")
+
+    assert runner.last_query() == "CALL gds.graph.exists($graph_name)"
+
+    graph_runner.nodeProperties.write
+    graph_runner.project("g", "A", "R")
+
+    assert runner.last_query() == "CALL gds.graph.project($graph_name, $node_spec, $relationship_spec, $config)"
+
+
+def test_graph_sub_runner_reuse(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+    graph_runner = gds.graph
+
+    assert gds.graph is graph_runner
+    assert graph_runner.nodeProperties is graph_runner.nodeProperties
+    assert graph_runner.export.csv is graph_runner.export.csv
+    assert graph_runner.sample.rwr is graph_runner.sample.rwr
+    assert graph_runner.sample.cnarw is graph_runner.sample.cnarw
+
+    graph_runner.nodeProperties.write(G, ["dummyProp"])
+    graph_runner.nodeProperties.drop(G, ["dummyProp"])
+    assert runner.last_query() == "CALL gds.graph.nodeProperties.drop($graph_name, $properties, $config)"
+
+    graph_runner.export.csv.estimate(G)
+    graph_runner.export.csv(G)
+    assert runner.last_query() == "CALL gds.graph.export.csv($graph_name, $config)"
+
+
 def test_graph_export(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     G, _ = gds.graph.project("g", "*", "*")
 
@@ -208,6 +242,27 @@ def test_graph_streamNodeProperties(runner: CollectingQueryRunner, gds: GraphDat
     }
 
 
+def test_graph_streamNodeProperties_separate_property_columns(
+    runner: CollectingQueryRunner, gds: GraphDataScience
+) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    runner.set__mock_result(
+        DataFrame(
+            [
+                {"nodeId": 1, "nodeProperty": "b", "propertyValue": 3},
+                {"nodeId": 0, "nodeProperty": "b", "propertyValue": 1},
+                {"nodeId": 0, "nodeProperty": "a", "propertyValue": 2},
+                {"nodeId": 1, "nodeProperty": "a", "propertyValue": 4},
+            ]
+        )
+    )
+
+    result = gds.graph.streamNodeProperties(G, ["a", "b"], separate_property_columns=True)
+    assert result.equals(DataFrame({"nodeId": [0, 1], "a": [2, 4], "b": [1, 3]}))
+    assert result.columns.name is None
+
+
 @pytest.mark.parametrize("server_version", [ServerVersion(2, 2, 0)])
 def test_graph_nodeProperties_stream(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     G, _ = gds.graph.project("g", "*", "*")
@@ -666,3 +721,15 @@ def test_graph_sample_cnarw(runner: CollectingQueryRunner, gds: GraphDataScience
         "from_graph_name": "g",
         "config": {"samplingRatio": 0.9, "concurrency": 7},
     }
+
+
+def test_io_thread_count() -> None:
+    assert _io_thread_count(None) is None
+    assert _io_thread_count("") is None
+    assert _io_thread_count("8") == 8
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-2"])
+def test_io_thread_count_invalid(value: str) -> None:
+    with pytest.warns(RuntimeWarning, match="GDS_IO_THREADS"):
+        assert _io_thread_count(value) is None
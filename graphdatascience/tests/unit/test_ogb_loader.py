@@ -1,9 +1,11 @@
+import warnings
 from typing import Any, Dict
 
 import numpy as np
 import numpy.typing as npt
 from pandas import Series
 
+from .conftest import CollectingQueryRunner
 from graphdatascience.graph.ogb_loader import (
     HeterogeneousOGBGraph,
     HeterogeneousOGBLDataset,
@@ -73,6 +75,25 @@ class HeteroOBGNTestDataset(HeterogeneousOGBNDataset):
         return {"train": {"A": np.array([0])}, "valid": {"A": np.array([])}, "test": {"A": np.array([])}}
 
 
+class HeteroOBGNSplitTestDataset(HeteroOBGNTestDataset):
+    def __init__(self) -> None:
+        super().__init__()
+        self.graph = {
+            "edge_index_dict": HETEROGENEOUS_EDGE_INDEX,
+            "num_nodes_dict": {"A": 3, "B": 1, "C": 1},
+        }
+        self.labels = {}
+
+    def get_idx_split(self) -> Dict[str, Dict[str, npt.NDArray[np.int64]]]:
+        return {"train": {"A": np.array([0])}, "valid": {"A": np.array([2])}, "test": {"A": np.array([1])}}
+
+
+class HeteroOBGNClassLabelTestDataset(HeteroOBGNSplitTestDataset):
+    def __init__(self) -> None:
+        super().__init__()
+        self.labels = {"A": np.array([[5], [7], [9]])}
+
+
 class HeteroOBGLTestDataset(HeterogeneousOGBLDataset):
     def __init__(self) -> None:
         self.graph: HeterogeneousOGBGraph = {
@@ -95,7 +116,7 @@ def test_ogbn_parse_homogeneous(gds: GraphDataScience) -> None:
 
     assert len(nodes) == 1
     assert nodes[0]["nodeId"].tolist() == HOMOGENEOUS_EXPECTED_NODES
-    assert nodes[0]["features"].tolist(), HOMOGENEOUS_NODE_FEAT
+    assert [list(f) for f in nodes[0]["features"]] == HOMOGENEOUS_NODE_FEAT
     assert nodes[0]["classLabel"].tolist() == HOMOGENEOUS_CLASS_LABELS
     assert nodes[0]["labels"].tolist() == ["Train", "Valid", "Test"]
 
@@ -110,7 +131,7 @@ def test_ogbl_parse_homogeneous(gds: GraphDataScience) -> None:
 
     assert len(nodes) == 1
     assert nodes[0]["nodeId"].tolist() == HOMOGENEOUS_EXPECTED_NODES
-    assert nodes[0]["features"].tolist() == HOMOGENEOUS_NODE_FEAT
+    assert [list(f) for f in nodes[0]["features"]] == HOMOGENEOUS_NODE_FEAT
     assert nodes[0]["labels"].tolist() == ["N"] * HOMOGENEOUS_NUM_NODES
 
     assert len(rels) == 1
@@ -125,7 +146,7 @@ def test_ogbn_parse_heterogeneous(gds: GraphDataScience) -> None:
     assert len(nodes) == 3
 
     assert nodes[0]["nodeId"].tolist() == [0]
-    assert nodes[0]["features"].tolist() == HETEROGENEOUS_NODE_FEAT["A"].tolist()
+    assert [list(f) for f in nodes[0]["features"]] == HETEROGENEOUS_NODE_FEAT["A"].tolist()
     assert nodes[0]["classLabel"].tolist() == [cl[0] for cl in HETEROGENEOUS_CLASS_LABELS["A"]]
     assert nodes[0]["labels"].tolist() == [["A", "Train"]]
 
@@ -135,7 +156,7 @@ def test_ogbn_parse_heterogeneous(gds: GraphDataScience) -> None:
     assert nodes[1]["labels"].tolist() == ["B"]
 
     assert nodes[2]["nodeId"].tolist() == [2]
-    assert nodes[2]["features"].tolist() == HETEROGENEOUS_NODE_FEAT["C"].tolist()
+    assert [list(f) for f in nodes[2]["features"]] == HETEROGENEOUS_NODE_FEAT["C"].tolist()
     assert "classLabel" not in nodes[2]
     assert nodes[2]["labels"].tolist() == ["C"]
 
@@ -150,13 +171,29 @@ def test_ogbn_parse_heterogeneous(gds: GraphDataScience) -> None:
     assert rels[1]["relationshipType"].tolist() == ["R2"] * len(HETEROGENEOUS_EDGE_INDEX[("B", "R2", "C")][0])
 
 
+def test_ogbn_parse_heterogeneous_split_labels(gds: GraphDataScience) -> None:
+    nodes, _ = gds.graph.ogbn._parse_heterogeneous(HeteroOBGNSplitTestDataset())
+
+    assert nodes[0]["nodeId"].tolist() == [0, 1, 2]
+    assert nodes[0]["labels"].tolist() == [["A", "Train"], ["A", "Test"], ["A", "Valid"]]
+    assert nodes[1]["nodeId"].tolist() == [3]
+    assert nodes[1]["labels"].tolist() == ["B"]
+
+
+def test_ogbn_parse_heterogeneous_class_labels(gds: GraphDataScience) -> None:
+    nodes, _ = gds.graph.ogbn._parse_heterogeneous(HeteroOBGNClassLabelTestDataset())
+
+    assert nodes[0]["classLabel"].tolist() == [5, 7, 9]
+    assert "classLabel" not in nodes[1]
+
+
 def test_ogbl_parse_heterogeneous(gds: GraphDataScience) -> None:
     nodes, rels = gds.graph.ogbl._parse_heterogeneous(HeteroOBGLTestDataset())
 
     assert len(nodes) == 3
 
     assert nodes[0]["nodeId"].tolist() == [0]
-    assert nodes[0]["features"].tolist() == HETEROGENEOUS_NODE_FEAT["A"].tolist()
+    assert [list(f) for f in nodes[0]["features"]] == HETEROGENEOUS_NODE_FEAT["A"].tolist()
     assert nodes[0]["labels"].tolist(), ["A"]
 
     assert nodes[1]["nodeId"].tolist() == [1]
@@ -164,7 +201,7 @@ def test_ogbl_parse_heterogeneous(gds: GraphDataScience) -> None:
     assert nodes[1]["labels"].tolist() == ["B"]
 
     assert nodes[2]["nodeId"].tolist() == [2]
-    assert nodes[2]["features"].tolist() == HETEROGENEOUS_NODE_FEAT["C"].tolist()
+    assert [list(f) for f in nodes[2]["features"]] == HETEROGENEOUS_NODE_FEAT["C"].tolist()
     assert nodes[2]["labels"].tolist() == ["C"]
 
     assert len(rels) == 3
@@ -180,3 +217,22 @@ def test_ogbl_parse_heterogeneous(gds: GraphDataScience) -> None:
     assert rels[1]["classLabel"].tolist() == [1] * len(HETEROGENEOUS_EDGE_INDEX[("B", "R2", "C")][0])
 
     assert len(rels[2]) == 0
+
+
+def test_ogbl_parse_heterogeneous_concurrently(gds: GraphDataScience) -> None:
+    nodes, rels = gds.graph.ogbl._parse_heterogeneous(HeteroOBGLTestDataset())
+    concurrent_nodes, concurrent_rels = gds.graph.ogbl._parse_heterogeneous(HeteroOBGLTestDataset(), concurrency=4)
+
+    assert [df["nodeId"].tolist() for df in concurrent_nodes] == [df["nodeId"].tolist() for df in nodes]
+    assert [df["labels"].tolist() for df in concurrent_nodes] == [df["labels"].tolist() for df in nodes]
+    assert all(concurrent.equals(rel) for concurrent, rel in zip(concurrent_rels, rels))
+
+
+def test_ogbn_construct_homogeneous_without_warnings(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes, rels = gds.graph.ogbn._parse_homogeneous(HomoOBGNTestDataset())
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        gds.graph.construct("ogb_test_graph", nodes, rels)
+
+    assert runner.last_params()["graph_name"] == "ogb_test_graph"
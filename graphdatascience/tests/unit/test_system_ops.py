@@ -1,4 +1,5 @@
 import pytest
+from pandas import DataFrame
 
 from .conftest import CollectingQueryRunner
 from graphdatascience.graph_data_science import GraphDataScience
@@ -31,6 +32,20 @@ def test_sysInfo(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     assert runner.last_params() == {}
 
 
+def test_debug_runner_reuse(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    debug = gds.debug
+    assert gds.debug is debug
+
+    debug.sysInfo()
+    debug.sysInfo()
+
+    assert runner.last_query() == "CALL gds.debug.sysInfo()"
+
+    debug.arrow()
+
+    assert runner.last_query() == "CALL gds.debug.arrow()"
+
+
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 5, 0))
 def test_userLog(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     gds.userLog()
@@ -88,3 +103,13 @@ def test_license_state(runner: CollectingQueryRunner, gds: GraphDataScience) ->
 
     assert runner.last_query() == "CALL gds.license.state()"
     assert runner.last_params() == {}
+
+
+def test_is_licensed_cached(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    runner.set__mock_result(DataFrame([{"gds.isLicensed()": True}]))
+    num_queries = len(runner.queries)
+
+    assert gds.is_licensed()
+    assert gds.is_licensed()
+
+    assert runner.queries[num_queries:] == ["RETURN gds.isLicensed()"]